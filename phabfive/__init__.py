@@ -11,40 +11,91 @@ __version__ = "0.4.0"
 __url__ = "https://github.com/dynamist/phabfive"
 
 
+_LOG_FORMAT = "%(levelname)s - %(message)s"
+_LOG_FORMATS = {
+    "DEBUG": "%(levelname)s - %(name)s:%(lineno)s - %(message)s",
+}
+
+_LOGGING_CONF = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "root": {
+        "level": "INFO",
+        "handlers": ["console"],
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "level": "INFO",
+            "formatter": "simple",
+            "stream": "ext://sys.stderr",
+        },
+    },
+    "formatters": {
+        "simple": {
+            "format": _LOG_FORMAT,
+        },
+    },
+}
+
+_CONFIGURED = False
+
+# Log level names accepted by init_logging() and their numeric values
+_LOG_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("CRITICAL", "FATAL", "ERROR", "WARN", "WARNING", "INFO", "DEBUG", "NOTSET")
+}
+
+
 def init_logging(log_level):
     """
     Init logging settings with default set to INFO
+
+    The logging configuration is only applied once, later calls only adjust the
+    level and formatter of the already configured root logger and handler.
     """
-    _log_level = logging.getLevelName(log_level)
+    global _CONFIGURED
 
-    if isinstance(_log_level, str):
-        print("CRITICAL: Undefined log-level set, please use any of the defined log levels inside Python logging module")
+    _log_level = _LOG_LEVELS.get(log_level)
+
+    if _log_level is None:
+        os.write(2, b"CRITICAL: Undefined log-level set, please use any of the defined log levels inside Python logging module\n")
         sys.exit(1)
 
-    if log_level == "DEBUG":
-        msg = "%(levelname)s - %(name)s:%(lineno)s - %(message)s"
-    else:
-        msg = "%(levelname)s - %(message)s"
+    root = logging.getLogger()
+
+    # Nothing to do when the requested level is already in effect
+    if _CONFIGURED and root.level == _log_level:
+        return
+
+    log_format = _LOG_FORMATS.get(log_level, _LOG_FORMAT)
+
+    if not _CONFIGURED:
+        # Only needed once per process and slower to import than logging itself,
+        # so `phabfive --help` and friends never pay for it
+        from logging.config import dictConfig
+
+        logging_conf = dict(_LOGGING_CONF)
+        logging_conf["root"] = dict(_LOGGING_CONF["root"], level=log_level)
+        logging_conf["handlers"] = {
+            "console": dict(_LOGGING_CONF["handlers"]["console"], level=log_level),
+        }
+        logging_conf["formatters"] = {
+            "simple": {"format": log_format},
+        }
+
+        dictConfig(logging_conf)
+        _CONFIGURED = True
+        return
+
+    root.setLevel(_log_level)
+
+    for handler in root.handlers:
+        handler.setLevel(_log_level)
+        handler.setFormatter(logging.Formatter(log_format))
 
-    logging_conf = {
-        "version": 1,
-        "root": {
-            "level": log_level,
-            "handlers": ["console"],
-        },
-        "handlers": {
-            "console": {
-                "class": "logging.StreamHandler",
-                "level": log_level,
-                "formatter": "simple",
-                "stream": "ext://sys.stdout",
-            },
-        },
-        "formatters": {
-            "simple": {
-                "format": f"{msg}",
-            },
-        },
-    }
 
-    logging.config.dictConfig(logging_conf)
+__all__ = [
+    "__version__",
+    "init_logging",
+]
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+# phabfive imports
+from phabfive.cli import cli_entrypoint
+
+cli_entrypoint()
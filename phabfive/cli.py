@@ -1,15 +1,29 @@
 # -*- coding: utf-8 -*-
 
 # python std lib
-import re
+import os
 import sys
-import logging
-import logging.config
-from datetime import datetime
-from pprint import pprint as pp
+from functools import lru_cache
+
+# phabfive imports
+from phabfive import __version__, init_logging
+from phabfive.constants import MONOGRAMS
 
 # 3rd party imports
-from docopt import docopt, extras, Option, DocoptExit
+# The cached docopt() below builds on these docopt 0.6.x internals, see setup.py
+from docopt import (
+    AnyOptions,
+    Dict,
+    DocoptExit,
+    Option,
+    TokenStream,
+    extras,
+    formal_usage,
+    parse_argv,
+    parse_defaults,
+    parse_pattern,
+    printable_usage,
+)
 
 
 base_args = """
@@ -37,6 +51,102 @@ Options:
     -V, --version         Display the version number and exit
 """
 
+# Monogram prefix letter to app name, ex. "T" -> "maniphest". Every monogram is
+# one of these letters followed by digits, i.e. `phabfive K123`
+_APP_BY_PREFIX = {monogram[0]: app for app, monogram in MONOGRAMS.items()}
+
+# Sub command a monogram shortcut expands to, ex. `phabfive T123` runs
+# `phabfive maniphest show T123`
+_MONOGRAM_ARGV_PREFIX = {
+    "diffusion": ("branch", "list"),
+    "maniphest": ("show",),
+    "passphrase": (),
+    "paste": ("show",),
+}
+
+# sub_args of a bare monogram shortcut, ex. `phabfive T123`, as (key, defaults)
+# where key is the argument the monogram itself goes in. The test suite checks
+# these against what docopt gives for the expanded command line
+_MONOGRAM_SUB_ARGS = {
+    "diffusion": (
+        "<repo>",
+        {
+            "active": False,
+            "all": False,
+            "branch": True,
+            "create": False,
+            "diffusion": True,
+            "edit": False,
+            "inactive": False,
+            "list": True,
+            "repo": False,
+            "uri": False,
+            "<credential>": None,
+            "<name>": None,
+            "<repo>": None,
+            "<uri>": None,
+            "--clone": False,
+            "--cred": None,
+            "--disable": False,
+            "--display": None,
+            "--enable": False,
+            "--help": False,
+            "--io": None,
+            "--mirror": False,
+            "--new_uri": None,
+            "--observe": False,
+            "--url": False,
+        },
+    ),
+    "maniphest": (
+        "<ticket_id>",
+        {
+            "add": False,
+            "comment": False,
+            "create": False,
+            "maniphest": True,
+            "search": False,
+            "show": True,
+            "<comment>": None,
+            "<config-file>": None,
+            "<project_name>": None,
+            "<ticket_id>": None,
+            "--all": False,
+            "--created-after": None,
+            "--dry-run": False,
+            "--help": False,
+            "--pp": False,
+            "--updated-after": None,
+        },
+    ),
+    "passphrase": (
+        "<id>",
+        {
+            "passphrase": True,
+            "<id>": None,
+            "--help": False,
+        },
+    ),
+    "paste": (
+        "<ids>",
+        {
+            "create": False,
+            "list": False,
+            "paste": True,
+            "show": True,
+            "<file>": None,
+            "<ids>": [],
+            "<title>": None,
+            "--help": False,
+            "--subscribers": None,
+            "--tags": None,
+        },
+    ),
+}
+
+# Same text as docopt prints for -h/--help
+_HELP_TEXT = base_args.strip("\n")
+
 sub_passphrase_args = """
 Usage:
     phabfive passphrase <id> [options]
@@ -132,281 +242,414 @@ Options:
     -h, --help           Show this help message and exit
 """
 
+# Usage string for each app
+_SUB_ARGS = {
+    "passphrase": sub_passphrase_args,
+    "diffusion": sub_diffusion_args,
+    "paste": sub_paste_args,
+    "user": sub_user_args,
+    "repl": sub_repl_args,
+    "maniphest": sub_maniphest_args,
+}
+
+# Ticket fields printed by `maniphest show --all`, as (label, key) in output order
+_TICKET_FIELDS_ALL = (
+    ("Ticket ID", "id"),
+    ("phid", "phid"),
+    ("authorPHID", "authorPHID"),
+    ("ownerPHID", "ownerPHID"),
+    ("ccPHIDs", "ccPHIDs"),
+    ("status", "status"),
+    ("statusName", "statusName"),
+    ("isClosed", "isClosed"),
+    ("priority", "priority"),
+    ("priorityColor", "priorityColor"),
+    ("title", "title"),
+    ("description", "description"),
+    ("projectPHIDs", "projectPHIDs"),
+    ("uri", "uri"),
+    ("auxiliary", "auxiliary"),
+    ("objectName", "objectName"),
+    ("dateCreated", "dateCreated"),
+    ("dateModified", "dateModified"),
+    ("dependsOnTaskPHIDs", "dependsOnTaskPHIDs"),
+)
+
+# Ticket fields printed by `maniphest show`
+_TICKET_FIELDS = (
+    ("Ticket ID", "id"),
+    ("phid", "phid"),
+    ("status", "status"),
+    ("priority", "priority"),
+    ("title", "title"),
+    ("uri", "uri"),
+    ("dateCreated", "dateCreated"),
+    ("dateModified", "dateModified"),
+)
+
+# Unix timestamps rendered as local date and time
+_TICKET_DATE_FIELDS = frozenset(("dateCreated", "dateModified"))
+
+
+@lru_cache(maxsize=None)
+def _compile_usage(doc):
+    """
+    Parse a docopt usage string into its (usage, options, pattern) grammar once
+
+    docopt itself re-tokenizes and re-parses the whole usage text on every call,
+    the result only depends on the usage string so it is safe to keep around.
+    """
+    usage = printable_usage(doc)
+    options = parse_defaults(doc)
+    pattern = parse_pattern(formal_usage(usage), options)
+    pattern_options = set(pattern.flat(Option))
+
+    for any_options in pattern.flat(AnyOptions):
+        any_options.children = list(set(options) - pattern_options)
+
+    return usage, options, pattern.fix()
+
+
+def docopt(doc, argv=None, help=True, version=None, options_first=False):
+    """
+    Drop-in replacement for docopt.docopt() that reuses the cached grammar from _compile_usage()
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    usage, options, pattern = _compile_usage(doc)
+    DocoptExit.usage = usage
+
+    # parse_argv() appends any option it does not know about to the list it is given
+    known_options = list(options)
+    argv = parse_argv(TokenStream(argv, DocoptExit), known_options, options_first)
+    # Handles -h/--help exactly like docopt, before any pattern matching is done
+    extras(help, version, argv, doc)
+
+    # Reject unknown options up front instead of running the pattern matcher on them
+    if len(known_options) != len(options):
+        raise DocoptExit()
+
+    matched, left, collected = pattern.match(argv)
+
+    if matched and left == []:
+        # Copy list values so the defaults stored in the cached pattern are never shared
+        return Dict(
+            (a.name, list(a.value) if type(a.value) is list else a.value)
+            for a in (pattern.flat() + collected)
+        )
+
+    raise DocoptExit()
+
+
+def _monogram_sub_args(app, monogram):
+    """
+    Build the sub_args docopt would give for a bare monogram shortcut
+    """
+    key, defaults = _MONOGRAM_SUB_ARGS[app]
+
+    sub_args = Dict(defaults)
+    sub_args[key] = [monogram] if type(defaults[key]) is list else monogram
+    sub_args["<sub_command>"] = monogram
+
+    return sub_args
+
 
 def parse_cli():
     """
     Parse the CLI arguments and options
     """
-    import phabfive
+    # Answer help, version and bare invocations directly instead of letting docopt
+    # parse the usage for them
+    if sys.argv[1:2] in ([], ["-h"], ["--help"]):
+        print(_HELP_TEXT)
+        sys.exit()
+
+    if sys.argv[1:2] in (["-V"], ["--version"]):
+        print(__version__)
+        sys.exit()
 
     try:
         cli_args = docopt(
             base_args,
             options_first=True,
-            version=phabfive.__version__,
+            version=__version__,
             help=True,
         )
     except DocoptExit:
-        extras(
-            True,
-            phabfive.__version__,
-            [Option("-h", "--help", 0, True)],
-            base_args,
-        )
-
-    phabfive.init_logging(cli_args["--log-level"])
-    log = logging.getLogger(__name__)
+        print(_HELP_TEXT)
+        sys.exit()
 
-    argv = [cli_args["<command>"]] + cli_args["<args>"]
+    command = cli_args["<command>"]
+    app = _APP_BY_PREFIX.get(command[:1])
+    rest = command[1:]
 
-    from phabfive.constants import MONOGRAMS
+    # First check for monogram shortcuts, i.e. invocation with `phabfive K123`
+    # instead of the full `phabfive passphrase K123`. isdecimal() alone would
+    # also accept non-ASCII digits, ex. fullwidth ones
+    if app and rest.isascii() and rest.isdecimal():
+        monogram = command
+        cli_args["<command>"] = app
 
-    patterns = re.compile("^(?:" + "|".join(MONOGRAMS.values()) + ")")
+        # A bare monogram always parses the same way, so skip docopt for it
+        if not cli_args["<args>"]:
+            cli_args["<args>"] = [monogram]
 
-    # First check for monogram shortcuts, i.e. invocation with `phabfive K123`
-    # instead of the full `phabfive passphrase K123`
-    if patterns.search(cli_args["<command>"]):
-        monogram = cli_args["<command>"]
-        app = {MONOGRAMS[k][0]: k for k in MONOGRAMS.keys()}[monogram[0]]
+            return (cli_args, _monogram_sub_args(app, monogram))
 
         # Patch the arguments to fool docopt into thinking we are the app
-        if app == "passphrase":
-            argv = [app] + argv
-        elif app == "diffusion":
-            argv = [app, "branch", "list"] + argv
-        elif app == "paste":
-            argv = [app, "show"] + argv
-        elif app == "user":
-            argv = [app, "whoami"] + argv
-        elif app == "maniphest":
-            argv = [app, "show"] + argv
-
+        argv = [app, *_MONOGRAM_ARGV_PREFIX[app], monogram, *cli_args["<args>"]]
         cli_args["<args>"] = [monogram]
-        cli_args["<command>"] = app
-        sub_args = docopt(eval("sub_{app}_args".format(app=app)), argv=argv) # nosec-B307
-    elif cli_args["<command>"] == "passphrase":
-        sub_args = docopt(sub_passphrase_args, argv=argv)
-    elif cli_args["<command>"] == "diffusion":
-        sub_args = docopt(sub_diffusion_args, argv=argv)
-    elif cli_args["<command>"] == "paste":
-        sub_args = docopt(sub_paste_args, argv=argv)
-    elif cli_args["<command>"] == "user":
-        sub_args = docopt(sub_user_args, argv=argv)
-    elif cli_args["<command>"] == "repl":
-        sub_args = docopt(sub_repl_args, argv=argv)
-    elif cli_args["<command>"] == "maniphest":
-        sub_args = docopt(sub_maniphest_args, argv=argv)
+    elif command in _SUB_ARGS:
+        argv = [command, *cli_args["<args>"]]
     else:
-        extras(
-            True,
-            phabfive.__version__,
-            [Option("-h", "--help", 0, True)],
-            base_args,
-        )
+        print(_HELP_TEXT)
         sys.exit(1)
 
+    sub_args = docopt(_SUB_ARGS[cli_args["<command>"]], argv=argv)
+
     if len(cli_args["<args>"]) > 0:
         sub_args["<sub_command>"] = cli_args["<args>"][0]
 
     return (cli_args, sub_args)
 
 
+def _csv_opt(value):
+    """
+    Split a comma separated option value, ex. "a, b,," -> ("a", "b")
+
+    Returns None when the option is not given.
+    """
+    if not value:
+        return None
+
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def _run_passphrase(sub_args):
+    """
+    Print a passphrase secret
+    """
+    from phabfive import passphrase
+
+    passphrase_app = passphrase.Passphrase()
+    passphrase_app.print_secret(sub_args["<id>"])
+
+    return 0
+
+
+def _run_diffusion(sub_args):
+    """
+    Handle the diffusion repo, uri and branch sub commands
+    """
+    from phabfive import diffusion
+
+    diffusion_app = diffusion.Diffusion()
+
+    if sub_args["repo"]:
+        if sub_args["list"]:
+            if sub_args["all"]:
+                status = None
+            elif sub_args["inactive"]:
+                status = ["inactive"]
+            else:  # default value
+                status = ["active"]
+
+            diffusion_app.print_repositories(status=status, url=sub_args["--url"])
+        elif sub_args["create"]:
+            diffusion_app.create_repository(name=sub_args["<name>"])
+    elif sub_args["uri"]:
+        if sub_args["create"]:
+            if sub_args["--mirror"]:
+                io = "mirror"
+                display = "always"
+            elif sub_args["--observe"]:
+                io = "observe"
+                display = "always"
+
+            created_uri = diffusion_app.create_uri(
+                repository_name=sub_args["<repo>"],
+                new_uri=sub_args["<uri>"],
+                io=io,
+                display=display,
+                credential=sub_args["<credential>"],
+            )
+            print(created_uri)
+        elif sub_args["list"]:
+            diffusion_app.print_uri(
+                repo=sub_args["<repo>"],
+                clone_uri=sub_args["--clone"],
+            )
+        elif sub_args["edit"]:
+            if sub_args["--enable"]:
+                disable = False
+            elif sub_args["--disable"]:
+                disable = True
+            else:
+                disable = None
+
+            if (
+                sub_args["--new_uri"] is None
+                and sub_args["--io"] is None
+                and sub_args["--display"] is None
+                and sub_args["--cred"] is None
+                and disable is None
+            ):
+                print("Please input minimum one option")
+                return 1
+
+            object_id = diffusion_app.get_object_identifier(
+                repo_name=sub_args["<repo>"],
+                uri_name=sub_args["<uri>"],
+            )
+
+            result = diffusion_app.edit_uri(
+                uri=sub_args["--new_uri"],
+                io=sub_args["--io"],
+                display=sub_args["--display"],
+                credential=sub_args["--cred"],
+                disable=disable,
+                object_identifier=object_id,
+            )
+
+            if result:
+                print("OK")
+    elif sub_args["branch"] and sub_args["list"]:
+        diffusion_app.print_branches(repo=sub_args["<repo>"])
+
+    return 0
+
+
+def _run_paste(sub_args):
+    """
+    Handle the paste list, create and show sub commands
+    """
+    from phabfive import paste
+
+    paste_app = paste.Paste()
+
+    if sub_args["list"]:
+        paste_app.print_pastes()
+    elif sub_args["create"]:
+        paste_app.create_paste(
+            title=sub_args["<title>"],
+            file=sub_args["<file>"],
+            tags=_csv_opt(sub_args["--tags"]),
+            subscribers=_csv_opt(sub_args["--subscribers"]),
+        )
+    elif sub_args["show"]:
+        if sub_args["<ids>"]:
+            paste_app.print_pastes(ids=sub_args["<ids>"])
+
+    return 0
+
+
+def _run_user(sub_args):
+    """
+    Print information about the current user
+    """
+    from phabfive import user
+
+    user_app = user.User()
+
+    if sub_args["whoami"]:
+        user_app.print_whoami()
+
+    return 0
+
+
+def _run_repl(sub_args):
+    """
+    Start the REPL
+    """
+    from phabfive import repl
+
+    repl_app = repl.Repl()
+    repl_app.run()
+
+    return 0
+
+
+def _run_maniphest(sub_args):
+    """
+    Handle the maniphest search, create, comment and show sub commands
+    """
+    from phabfive import maniphest
+
+    maniphest_app = maniphest.Maniphest()
+
+    if sub_args["search"]:
+        maniphest_app.task_search(
+            sub_args["<project_name>"],
+            created_after=sub_args["--created-after"],
+            updated_after=sub_args["--updated-after"],
+        )
+
+    elif sub_args["create"]:
+        # This part is responsible for bulk creating several tickets at once
+        maniphest_app.create_from_config(
+            sub_args["<config-file>"],
+            dry_run = sub_args["--dry-run"],
+        )
+
+    elif sub_args["comment"] and sub_args["add"]:
+        result, ticket_uri = maniphest_app.add_comment(sub_args["<ticket_id>"], sub_args["<comment>"],)
+
+        if result:
+            print("Comment successfully added")
+            print("Ticket URI: {0}".format(ticket_uri))
+
+    elif sub_args["show"]:
+        # Only needed to render a ticket, keep them out of the startup path
+        from datetime import datetime
+        from pprint import pprint as pp
+
+        _, result = maniphest_app.info(int(sub_args["<ticket_id>"][1:]))
+
+        if sub_args["--pp"]:
+            pp({key: value for key, value in result.items()})
+        else:
+            if sub_args["--all"]:
+                fields, width = _TICKET_FIELDS_ALL, 15
+            else:
+                fields, width = _TICKET_FIELDS, 14
+
+            lines = []
+
+            for label, key in fields:
+                value = result[key]
+
+                if key in _TICKET_DATE_FIELDS:
+                    value = datetime.fromtimestamp(int(value))
+
+                lines.append(f"{label + ':':<{width}} {value}")
+
+            print("\n".join(lines))
+
+    return 0
+
+
+_COMMANDS = {
+    "passphrase": _run_passphrase,
+    "diffusion": _run_diffusion,
+    "paste": _run_paste,
+    "user": _run_user,
+    "repl": _run_repl,
+    "maniphest": _run_maniphest,
+}
+
+
 def run(cli_args, sub_args):
     """
     Execute the CLI
     """
-    # Local imports required due to logging limitation
-    from phabfive import passphrase, diffusion, paste, user, repl, maniphest
-    from phabfive.constants import REPO_STATUS_CHOICES
     from phabfive.exceptions import PhabfiveException
 
-    retcode = 0
+    # Configured here rather than in parse_cli() so help and usage errors never do it
+    init_logging(cli_args["--log-level"])
 
     try:
-        if cli_args["<command>"] == "passphrase":
-            passphrase_app = passphrase.Passphrase()
-            passphrase_app.print_secret(sub_args["<id>"])
-
-        if cli_args["<command>"] == "diffusion":
-            diffusion_app = diffusion.Diffusion()
-
-            if sub_args["repo"]:
-                if sub_args["list"]:
-                    if sub_args["all"]:
-                        status = REPO_STATUS_CHOICES
-                    elif sub_args["inactive"]:
-                        status = ["inactive"]
-                    else:  # default value
-                        status = ["active"]
-
-                    diffusion_app.print_repositories(status=status, url=sub_args["--url"])
-                elif sub_args["create"]:
-                    diffusion_app.create_repository(name=sub_args["<name>"])
-            elif sub_args["uri"]:
-                if sub_args["create"]:
-                    if sub_args["--mirror"]:
-                        io = "mirror"
-                        display = "always"
-                    elif sub_args["--observe"]:
-                        io = "observe"
-                        display = "always"
-
-                    created_uri = diffusion_app.create_uri(
-                        repository_name=sub_args["<repo>"],
-                        new_uri=sub_args["<uri>"],
-                        io=io,
-                        display=display,
-                        credential=sub_args["<credential>"],
-                    )
-                    print(created_uri)
-                elif sub_args["list"]:
-                    diffusion_app.print_uri(
-                        repo=sub_args["<repo>"],
-                        clone_uri=sub_args["--clone"],
-                    )
-                elif sub_args["edit"]:
-                    object_id = diffusion_app.get_object_identifier(
-                        repo_name=sub_args["<repo>"],
-                        uri_name=sub_args["<uri>"],
-                    )
-
-                    if sub_args["--enable"]:
-                        disable = False
-                    elif sub_args["--disable"]:
-                        disable = True
-                    else:
-                        disable = None
-
-                    _data = [
-                        sub_args["--new_uri"],
-                        sub_args["--io"],
-                        sub_args["--display"],
-                        sub_args["--cred"],
-                        disable,
-                    ]
-
-                    if all(arg is None for arg in _data):
-                        print("Please input minimum one option")
-
-                    result = diffusion_app.edit_uri(
-                        uri=sub_args["--new_uri"],
-                        io=sub_args["--io"],
-                        display=sub_args["--display"],
-                        credential=sub_args["--cred"],
-                        disable=disable,
-                        object_identifier=object_id,
-                    )
-
-                    if result:
-                        print("OK")
-            elif sub_args["branch"] and sub_args["list"]:
-                diffusion_app.print_branches(repo=sub_args["<repo>"])
-
-        if cli_args["<command>"] == "paste":
-            paste_app = paste.Paste()
-
-            if sub_args["list"]:
-                paste_app.print_pastes()
-            elif sub_args["create"]:
-                tags_list = None
-                subscribers_list = None
-
-                if sub_args["--tags"]:
-                    tags_list = sub_args["--tags"].split(",")
-
-                if sub_args["--subscribers"]:
-                    subscribers_list = sub_args["--subscribers"].split(",")
-
-                paste_app.create_paste(
-                    title=sub_args["<title>"],
-                    file=sub_args["<file>"],
-                    tags=tags_list,
-                    subscribers=subscribers_list,
-                )
-            elif sub_args["show"]:
-                if sub_args["<ids>"]:
-                    paste_app.print_pastes(ids=sub_args["<ids>"])
-
-        if cli_args["<command>"] == "user":
-            user_app = user.User()
-
-            if sub_args["whoami"]:
-                user_app.print_whoami()
-
-        if cli_args["<command>"] == "repl":
-            repl_app = repl.Repl()
-            repl_app.run()
-
-        if cli_args["<command>"] == "maniphest":
-            maniphest_app = maniphest.Maniphest()
-
-            if sub_args["search"]:
-
-                maniphest_app.task_search(
-                    sub_args["<project_name>"],
-                    created_after=sub_args["--created-after"],
-                    updated_after=sub_args["--updated-after"],
-                )
-
-            if sub_args["create"]:
-                # This part is responsible for bulk creating several tickets at once
-                maniphest_app.create_from_config(
-                    sub_args["<config-file>"],
-                    dry_run = sub_args["--dry-run"],
-                )
-
-            if sub_args["comment"] and sub_args["add"]:
-                result = maniphest_app.add_comment(sub_args["<ticket_id>"], sub_args["<comment>"],)
-
-                if result[0]:
-                    # Query the ticket to fetch the URI for it
-                    _, ticket = maniphest_app.info(int(sub_args["<ticket_id>"][1:]))
-
-                    print("Comment successfully added")
-                    print("Ticket URI: {0}".format(ticket["uri"]))
-
-            if sub_args["show"]:
-                _, result = maniphest_app.info(int(sub_args["<ticket_id>"][1:]))
-
-                if sub_args["--pp"]:
-                    pp({key: value for key, value in result.items()})
-                elif sub_args["--all"]:
-                    print(f"Ticket ID:      {result['id']}")
-                    print(f"phid:           {result['phid']}")
-                    print(f"authorPHID:     {result['authorPHID']}")
-                    print(f"ownerPHID:      {result['ownerPHID']}")
-                    print(f"ccPHIDs:        {result['ccPHIDs']}")
-                    print(f"status:         {result['status']}")
-                    print(f"statusName:     {result['statusName']}")
-                    print(f"isClosed:       {result['isClosed']}")
-                    print(f"priority:       {result['priority']}")
-                    print(f"priorityColor:  {result['priorityColor']}")
-                    print(f"title:          {result['title']}")
-                    print(f"description:    {result['description']}")
-                    print(f"projectPHIDs:   {result['projectPHIDs']}")
-                    print(f"uri:            {result['uri']}")
-                    print(f"auxiliary:      {result['auxiliary']}")
-                    print(f"objectName:     {result['objectName']}")
-
-                    date_created = datetime.fromtimestamp(int(result['dateCreated']))
-                    print(f"dateCreated:    {date_created}")
-
-                    date_modified = datetime.fromtimestamp(int(result['dateModified']))
-                    print(f"dateModified:   {date_modified}")
-
-                    print(f"dependsOnTaskPHIDs: {result['dependsOnTaskPHIDs']}")
-                else:
-                    print(f"Ticket ID:     {result['id']}")
-                    print(f"phid:          {result['phid']}")
-                    print(f"status:        {result['status']}")
-                    print(f"priority:      {result['priority']}")
-                    print(f"title:         {result['title']}")
-                    print(f"uri:           {result['uri']}")
-                    date_created = datetime.fromtimestamp(int(result['dateCreated']))
-                    print(f"dateCreated:   {date_created}")
-
-                    date_modified = datetime.fromtimestamp(int(result['dateModified']))
-                    print(f"dateModified:  {date_modified}")
+        retcode = _COMMANDS[cli_args["<command>"]](sub_args)
     except PhabfiveException as e:
         # Catch all types of phabricator base exceptions
         print(f"CRITICAL :: {str(e)}", file=sys.stderr)
@@ -420,6 +663,14 @@ def cli_entrypoint():
     cli_args, sub_args = parse_cli()
 
     try:
-        sys.exit(run(cli_args, sub_args))
-    except Exception:
-        raise
+        retcode = run(cli_args, sub_args)
+
+        # Flush here so a closed stdout is reported below and not at interpreter exit
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away, ex. `phabfive paste list | head`. Point stdout at
+        # devnull so the flush at interpreter exit does not fail a second time
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+    sys.exit(retcode)
@@ -13,13 +13,16 @@ from phabfive.exceptions import PhabfiveDataException, PhabfiveConfigException
 from phabricator import APIError
 
 
+DIFFUSION_ID_PATTERN = re.compile(f"^{MONOGRAMS['diffusion']}$")
+
+
 class Diffusion(Phabfive):
     def __init__(self):
         super(Diffusion, self).__init__()
         self.passphrase = passphrase.Passphrase()
 
     def _validate_identifier(self, repo_id):
-        return re.match(f"^{MONOGRAMS['diffusion']}$", repo_id)
+        return DIFFUSION_ID_PATTERN.match(repo_id)
 
     def _validate_credential_type(self, credential):
         for key in credential:
@@ -330,8 +333,8 @@ class Diffusion(Phabfive):
         else:
             uris = self.get_uris(repo_id=repo, clone_uri=clone_uri)
 
-        for uri in uris:
-            print(uri)
+        if uris:
+            print("\n".join(uris))
 
     def get_repositories(self, query_key=None, attachments=None, constraints=None):
         """
@@ -388,20 +391,21 @@ class Diffusion(Phabfive):
     def print_repositories(self, status=None, url=False):
         """
         Method used by the Phabfive CLI
-        """
-        status = status or REPO_STATUS_CHOICES
 
+        `status` defaults to None, which lists repositories of any status
+        """
         repos = self.get_repositories(attachments={"uris": url})
 
         if not repos:
             raise PhabfiveDataException("No data or other error")
 
-        # filter based on active or inactive status
-        repos = [
-            repo
-            for repo in repos
-            if repo["fields"]["status"] in status
-        ]
+        # filter based on active or inactive status, no need to when all are wanted
+        if status:
+            repos = [
+                repo
+                for repo in repos
+                if repo["fields"]["status"] in status
+            ]
 
         # sort based on name
         repos = sorted(
@@ -410,21 +414,20 @@ class Diffusion(Phabfive):
         )
 
         if url:
-            for repo in repos:
-                uris = repo["attachments"]["uris"]["uris"]
-
+            lines = [
                 # filter based on visibility
-                repo_urls = [
+                ", ".join(
                     uri["fields"]["uri"]["effective"]
-                    for uri in uris
+                    for uri in repo["attachments"]["uris"]["uris"]
                     if uri["fields"]["display"]["effective"] == "always"
-                ]
-
-                print(", ".join(repo_urls))
+                )
+                for repo in repos
+            ]
         else:
-            for repo in repos:
-                repo_name = repo["fields"].get("name", "")
-                print(repo_name)
+            lines = [repo["fields"].get("name", "") for repo in repos]
+
+        if lines:
+            print("\n".join(lines))
 
     def print_branches(self, repo):
         """
@@ -442,8 +445,8 @@ class Diffusion(Phabfive):
             if branch["refType"] == "branch"
         )
 
-        for branch_name in branch_names:
-            print(branch_name)
+        if branch_names:
+            print("\n".join(branch_names))
 
     def _resolve_shortname_to_id(self, shortname):
         repos = self.get_repositories()
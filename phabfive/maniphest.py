@@ -17,8 +17,18 @@ from phabfive.exceptions import *
 import yaml
 from jinja2 import Template
 
+# Use the libyaml backed loader when PyYAML is built with it
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 log = logging.getLogger(__name__)
 
+# Deletion table for characters that can't be used unquoted in a YAML scalar
+YAML_SPECIAL_CHARS = str.maketrans("", "", ":{}[]`'\"")
+
+
 class Maniphest(Phabfive):
     def __init__(self):
         super(Maniphest, self).__init__()
@@ -54,62 +64,91 @@ class Maniphest(Phabfive):
         log.debug(f"JSON constraints: \n{json.dumps(constraints, indent=2)}\n")
         log.debug(f"JSON attachments: \n{json.dumps(attachments, indent=2)}\n")
 
-        result = self.phab.maniphest.search(constraints=constraints, attachments=attachments)
-
-        log.debug(f"JSON result.response: \n{json.dumps(result.response, indent=2)}\n")
-
-        for item in result.response["data"]:
-            print(f"Link: {self.url}/T{item['id']}")
-            fields = item.get("fields", {})
-            date_closed = ""
-
-            for key, value in fields.items():
-                if key in ["dateCreated", "dateModified"]:
-                    if value:
-                        formatted_time = format_timestamp(value)
-                        print(f"{key[4:]}: {formatted_time}")
-                elif key == "dateClosed":
-                    if value:
-                        date_closed = format_timestamp(value)
-                        print(f"Closed: {date_closed}")
-                elif key == "name":
-                    print(f"Name: '{value}'" if "[" in value else f"Name: {value}")
-
-            status_name = fields.get("status", {}).get("name", "Unknown")
-            print(f"Status: {status_name} {date_closed}")
-
-            priority_name = fields.get("priority", {}).get("name", "Unknown")
-            print(f"Priority: {priority_name}")
-
-            boards = item.get("attachments", {}).get("columns", {}).get("boards", {})
-
-            for board_data in boards.values():
-                columns = board_data.get("columns", [])
-                for column in columns:
-                    column_name = column.get("name")
-                    columns_no = len(columns)
-                    if column_name:
-                        print(f"Column: {column_name} {columns_no}")
-
-            description_raw = fields.get("description", {}).get("raw", "")
-            if description_raw:
-                print(f"Description: |")
-                print("  >", "  > ".join(description_raw.splitlines(True)), end="")
-            else:
-                print(f"Description: ''", end="")
-            print("\n")
+        # Print every page of results as soon as it arrives instead of waiting for all of them
+        for tasks in self._search_pages(constraints=constraints, attachments=attachments):
+            print("".join(self._format_task(item) for item in tasks), end="")
+
+    def _search_pages(self, constraints, attachments):
+        """
+        Yield the tasks of each page of maniphest.search results, following the result cursor.
+        """
+        search_args = {"constraints": constraints, "attachments": attachments}
+
+        while True:
+            result = self.phab.maniphest.search(**search_args)
+
+            log.debug(f"JSON result.response: \n{json.dumps(result.response, indent=2)}\n")
+
+            yield result.response["data"]
+
+            after = (result.response.get("cursor") or {}).get("after")
+
+            if not after:
+                break
+
+            search_args["after"] = after
+
+    def _format_task(self, item):
+        """
+        Render a task from maniphest.search as text.
+        """
+        lines = [f"Link: {self.url}/T{item['id']}"]
+        fields = item.get("fields", {})
+        date_closed = ""
+
+        for key, value in fields.items():
+            if key in ["dateCreated", "dateModified"]:
+                if value:
+                    formatted_time = format_timestamp(value)
+                    lines.append(f"{key[4:]}: {formatted_time}")
+            elif key == "dateClosed":
+                if value:
+                    date_closed = format_timestamp(value)
+                    lines.append(f"Closed: {date_closed}")
+            elif key == "name":
+                lines.append(f"Name: {yaml_quote(value)}")
+
+        status_name = fields.get("status", {}).get("name", "Unknown")
+        lines.append(f"Status: {status_name} {date_closed}")
+
+        priority_name = fields.get("priority", {}).get("name", "Unknown")
+        lines.append(f"Priority: {priority_name}")
+
+        boards = item.get("attachments", {}).get("columns", {}).get("boards", {})
+
+        for board_data in boards.values():
+            columns = board_data.get("columns", [])
+            columns_no = len(columns)
+            for column in columns:
+                column_name = column.get("name")
+                if column_name:
+                    lines.append(f"Column: {column_name} {columns_no}")
+
+        description_raw = fields.get("description", {}).get("raw", "")
+        if description_raw:
+            lines.append("Description: |")
+            lines.append("  > " + "  > ".join(description_raw.splitlines(True)))
+        else:
+            lines.append("Description: ''")
+
+        return "\n".join(lines) + "\n\n"
 
     def add_comment(self, ticket_identifier, comment_string):
         """
+        Add a comment to a ticket and return the URI of the ticket
+
         :type ticket_identifier: str
         :type comment_string: str
+
+        :rtype: tuple
         """
         result = self.phab.maniphest.edit(
             transactions=self.to_transactions({"comment": comment_string}),
             objectIdentifier=ticket_identifier,
         )
 
-        return (True, result["object"])
+        # The edit response carries the task id, no need to query the ticket again for its URI
+        return (True, f"{self.url}/T{result['object']['id']}")
 
     def info(self, task_id):
         """
@@ -128,7 +167,7 @@ class Maniphest(Phabfive):
             log.error(f"Config file '{config_file}' do not exists")
 
         with open(config_file) as stream:
-            root_data = yaml.load(stream, Loader=yaml.Loader) # nosec-B506
+            root_data = yaml.load(stream, Loader=YAMLLoader)
 
         # Fetch all users in phabricator, used by subscribers mapping later
         users_query = self.phab.user.search()
@@ -383,4 +422,21 @@ def format_timestamp(timestamp):
     Convert UNIX timestamp to ISO 8601 string (readable time format).
     """
     dt = datetime.datetime.fromtimestamp(timestamp)
-    return dt.strftime('%Y-%m-%dT%H:%M:%S')
\ No newline at end of file
+    return dt.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def needs_yaml_quoting(value):
+    """
+    Check if a value must be quoted to be printed as a YAML scalar.
+    """
+    return not value or len(value.translate(YAML_SPECIAL_CHARS)) != len(value)
+
+
+def yaml_quote(value):
+    """
+    Return value as a YAML scalar, single quoted and escaped only when needed.
+    """
+    if not needs_yaml_quoting(value):
+        return value
+
+    return "'" + value.replace("'", "''") + "'"
@@ -16,13 +16,15 @@ from phabricator import APIError
 
 log = logging.getLogger(__name__)
 
+PASSPHRASE_ID_PATTERN = re.compile(f"^{MONOGRAMS['passphrase']}$")
+
 
 class Passphrase(Phabfive):
     def __init__(self):
         super(Passphrase, self).__init__()
 
     def _validate_identifier(self, id_):
-        return re.match(f"^{MONOGRAMS['passphrase']}$", id_)
+        return PASSPHRASE_ID_PATTERN.match(id_)
 
     def get_secret(self, ids):
         if not self._validate_identifier(ids):
@@ -61,7 +63,12 @@ class Passphrase(Phabfive):
     def print_secret(self, ids):
         secret = self.get_secret(ids)
 
-        for value in secret.values():
-            for secret_type, secret_value in value["material"].items():
-                if secret_type == "password": # nosec-B105
-                    print(secret_value)
+        passwords = [
+            secret_value
+            for value in secret.values()
+            for secret_type, secret_value in value["material"].items()
+            if secret_type == "password" # nosec-B105
+        ]
+
+        if passwords:
+            print("\n".join(passwords))
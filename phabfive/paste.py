@@ -12,12 +12,15 @@ from phabfive.exceptions import PhabfiveDataException
 from phabricator import APIError
 
 
+PASTE_ID_PATTERN = re.compile(f"^{MONOGRAMS['paste']}$")
+
+
 class Paste(Phabfive):
     def __init__(self):
         super(Paste, self).__init__()
 
     def _validate_identifier(self, id_):
-        return re.match(f"^{MONOGRAMS['paste']}$", id_)
+        return PASTE_ID_PATTERN.match(id_)
 
     def _convert_ids(self, ids):
         """
@@ -43,14 +46,14 @@ class Paste(Phabfive):
         :type title: str
         :type file: str
         :type language: str
-        :type tags: list
-        :type subscribers: list
+        :type tags: list or tuple
+        :type subscribers: list or tuple
 
         :rtype: dict
         """
         text = None
-        tags = tags if tags else []
-        subscribers = subscribers if subscribers else []
+        tags = list(tags) if tags else []
+        subscribers = list(subscribers) if subscribers else []
 
         with open(file, "r") as f:
             text = f.read()
@@ -124,8 +127,7 @@ class Paste(Phabfive):
             key=lambda key: key["fields"]["title"]
         )
 
-        for item in response:
-            paste = item["fields"]["title"]
-            paste_id = f"P{item['id']}"
-
-            print(f"{paste_id} {paste}")
+        print("\n".join(
+            f"P{item['id']} {item['fields']['title']}"
+            for item in response
+        ))
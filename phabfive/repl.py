@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 # python std lib
+import importlib
 import logging
 import pdb
 import rlcompleter
@@ -16,14 +17,31 @@ log = logging.getLogger(__name__)
 class Repl(Phabfive):
     def __init__(self):
         super(Repl, self).__init__()
+        self._apps = {}
+
+    def app(self, name):
+        """
+        Return an instance of a phabfive app, ex. self.app("maniphest")
+
+        Every app loads its config and verifies the connection when created, so
+        each app is only created once and reused for the rest of the session.
+        """
+        if name not in self._apps:
+            module = importlib.import_module(f"phabfive.{name}")
+            self._apps[name] = getattr(module, name.capitalize())()
+
+        return self._apps[name]
 
     def run(self):
-        print("*************")
-        print("use self.phab to access the phacility API")
-        print("use self.conf to access current client configuration")
-        print("use self.url to get server address")
-        print("use pp() to prettyprint the API response back from self.phab.* calls")
-        print("*************")
+        print(
+            "*************\n"
+            "use self.phab to access the phacility API\n"
+            "use self.conf to access current client configuration\n"
+            "use self.url to get server address\n"
+            "use self.app(name) to get a phabfive app, ex. self.app('maniphest').info(1)\n"
+            "use pp() to prettyprint the API response back from self.phab.* calls\n"
+            "*************"
+        )
 
         pdb.Pdb.complete=rlcompleter.Completer(locals()).complete
         pdb.set_trace()
@@ -29,11 +29,8 @@ class User(Phabfive):
     def print_whoami(self):
         whoami = self.get_whoami()
 
-        to_print = {
-            key: value
+        print("\n".join(
+            f"{key}: {value}"
             for (key, value) in whoami.items()
             if key in ["userName", "realName", "primaryEmail", "uri"]
-        }
-
-        for key, value in to_print.items():
-            print("{0}: {1}".format(key, value))
+        ))
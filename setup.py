@@ -17,7 +17,7 @@ with open("CHANGELOG.md") as f:
 install_requires = [
     "anyconfig>=0.10.0",
     "appdirs",
-    "docopt",
+    "docopt>=0.6.2,<0.7",
     "jinja2",
     "phabricator",
     "pyyaml",
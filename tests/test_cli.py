@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# 3rd party imports
+import docopt
+import pytest
+
+
+def test_cached_docopt_matches_docopt():
+    from phabfive import cli
+
+    argv = ["paste", "show", "P1", "P2"]
+    expected = docopt.docopt(cli.sub_paste_args, argv=argv)
+
+    # Run twice so the second call goes through the cached grammar
+    assert cli.docopt(cli.sub_paste_args, argv=argv) == expected
+    assert cli.docopt(cli.sub_paste_args, argv=argv) == expected
+
+
+def test_cached_docopt_rejects_unknown_option():
+    from phabfive import cli
+
+    with pytest.raises(docopt.DocoptExit):
+        cli.docopt(cli.sub_paste_args, argv=["paste", "list", "--unknown"])
+
+
+def test_parse_cli_help(monkeypatch, capsys):
+    from phabfive import cli
+
+    monkeypatch.setattr("sys.argv", ["phabfive", "--help"])
+
+    with pytest.raises(SystemExit):
+        cli.parse_cli()
+
+    assert capsys.readouterr().out == cli.base_args.strip("\n") + "\n"
+
+
+def test_parse_cli_monogram_shortcut(monkeypatch):
+    from phabfive import cli
+
+    monkeypatch.setattr("sys.argv", ["phabfive", "T123"])
+    cli_args, sub_args = cli.parse_cli()
+
+    assert cli_args["<command>"] == "maniphest"
+    assert sub_args["show"]
+    assert sub_args["<ticket_id>"] == "T123"
+
+
+@pytest.mark.parametrize("argv", [["-V"], ["--version"]])
+def test_parse_cli_version(monkeypatch, capsys, argv):
+    from phabfive import __version__, cli
+
+    monkeypatch.setattr("sys.argv", ["phabfive"] + argv)
+
+    with pytest.raises(SystemExit):
+        cli.parse_cli()
+
+    assert capsys.readouterr().out == __version__ + "\n"
+
+
+@pytest.mark.parametrize("command", ["T123abc", "T", "T\uff11\uff12", "T\u0661\u0662"])
+def test_parse_cli_rejects_partial_monogram(monkeypatch, command):
+    from phabfive import cli
+
+    monkeypatch.setattr("sys.argv", ["phabfive", command])
+
+    with pytest.raises(SystemExit) as exc:
+        cli.parse_cli()
+
+    assert exc.value.code == 1
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["paste", "--help"], ["paste", "show", "P1", "-h"], ["P1", "-h"]],
+)
+def test_parse_cli_sub_command_help(monkeypatch, capsys, argv):
+    from phabfive import cli
+
+    monkeypatch.setattr("sys.argv", ["phabfive"] + argv)
+
+    with pytest.raises(SystemExit):
+        cli.parse_cli()
+
+    assert capsys.readouterr().out == cli.sub_paste_args.strip("\n") + "\n"
+
+
+def test_csv_opt():
+    from phabfive import cli
+
+    assert cli._csv_opt(None) is None
+    assert cli._csv_opt("") is None
+    assert cli._csv_opt("a") == ("a",)
+    assert cli._csv_opt("a, b,,") == ("a", "b")
+
+
+def test_monogram_argv_prefix_covers_monograms():
+    from phabfive import cli
+    from phabfive.constants import MONOGRAMS
+
+    assert set(cli._MONOGRAM_ARGV_PREFIX) == set(MONOGRAMS)
+
+
+@pytest.mark.parametrize("monogram", ["K1", "P22", "R333", "T4444"])
+def test_monogram_sub_args_match_docopt(monogram):
+    from phabfive import cli
+
+    app = cli._APP_BY_PREFIX[monogram[0]]
+    argv = [app, *cli._MONOGRAM_ARGV_PREFIX[app], monogram]
+    expected = docopt.docopt(cli._SUB_ARGS[app], argv=argv)
+    expected["<sub_command>"] = monogram
+
+    assert cli._monogram_sub_args(app, monogram) == expected
+
+
+def test_monogram_sub_args_are_not_shared():
+    from phabfive import cli
+
+    cli._monogram_sub_args("paste", "P1")["<ids>"].append("P2")
+
+    assert cli._monogram_sub_args("paste", "P3")["<ids>"] == ["P3"]
+
+
+def test_parse_cli_help_as_option_value(monkeypatch):
+    from phabfive import cli
+
+    monkeypatch.setattr(
+        "sys.argv", ["phabfive", "paste", "create", "title", "file", "--tags", "-h"]
+    )
+    cli_args, sub_args = cli.parse_cli()
+
+    assert sub_args["create"]
+    assert sub_args["--tags"] == "-h"
+
+
+def test_cli_entrypoint_broken_pipe(monkeypatch):
+    from types import SimpleNamespace
+
+    from phabfive import cli
+
+    def run(cli_args, sub_args):
+        raise BrokenPipeError()
+
+    dup2_calls = []
+
+    monkeypatch.setattr(cli, "parse_cli", lambda: ({}, {}))
+    monkeypatch.setattr(cli, "run", run)
+    monkeypatch.setattr("sys.stdout", SimpleNamespace(fileno=lambda: 1))
+    monkeypatch.setattr(cli.os, "open", lambda path, flags: 42)
+    monkeypatch.setattr(cli.os, "dup2", lambda fd, fd2: dup2_calls.append((fd, fd2)))
+
+    with pytest.raises(SystemExit) as exc:
+        cli.cli_entrypoint()
+
+    assert exc.value.code == 1
+    assert dup2_calls == [(42, 1)]
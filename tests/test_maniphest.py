@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+
+def test_needs_yaml_quoting():
+    from phabfive.maniphest import needs_yaml_quoting
+
+    assert needs_yaml_quoting("")
+    assert needs_yaml_quoting("[WIP] Fix build")
+    assert needs_yaml_quoting("Fix: build")
+    assert not needs_yaml_quoting("Fix build")
+
+
+def test_yaml_quote():
+    from phabfive.maniphest import yaml_quote
+
+    assert yaml_quote("Fix build") == "Fix build"
+    assert yaml_quote("[WIP] Fix build") == "'[WIP] Fix build'"
+    assert yaml_quote("Don't: panic") == "'Don''t: panic'"
+
+
+def test_task_search_follows_cursor(capsys):
+    from types import SimpleNamespace
+
+    from phabfive.maniphest import Maniphest
+
+    pages = [
+        {"data": [{"id": 1, "fields": {"name": "First"}}], "cursor": {"after": "1"}},
+        {"data": [{"id": 2, "fields": {"name": "Second"}}], "cursor": {"after": None}},
+    ]
+    calls = []
+
+    def search(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(response=pages[len(calls) - 1])
+
+    # Skip Phabfive.__init__, it needs a configured Phabricator instance
+    maniphest = Maniphest.__new__(Maniphest)
+    maniphest.phab = SimpleNamespace(maniphest=SimpleNamespace(search=search))
+    maniphest.url = "https://phabricator.example.com"
+
+    maniphest.task_search("Project")
+
+    assert len(calls) == 2
+    assert "after" not in calls[0]
+    assert calls[1]["after"] == "1"
+    assert calls[1]["constraints"] == {"projects": ["Project"]}
+
+    out = capsys.readouterr().out
+    assert "Link: https://phabricator.example.com/T1\nName: First\n" in out
+    assert "Link: https://phabricator.example.com/T2\nName: Second\n" in out